@@ -1,5 +1,41 @@
 import os
-from typing import List
+from typing import Iterable, Iterator, List, Optional
+
+
+def _iter_files(root: str, suffix: str) -> Iterator[str]:
+    """Recursively yields paths under `root` whose names end with `suffix`.
+
+    Follows os.walk: a directory's own files come before its subdirectories,
+    symlinked directories are not descended into, and unreadable directories
+    are skipped.
+    """
+    files, subdirs = [], []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        is_symlink = False
+                    if not is_symlink:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    files.append(entry.path)
+    except OSError:
+        return
+    yield from files
+    for subdir in subdirs:
+        yield from _iter_files(subdir, suffix)
+
+
+def _read_file(path: str, encoding: str) -> str:
+    with open(path, "r", encoding=encoding) as f:
+        return f.read()
 
 
 class TextFileLoader:
@@ -8,39 +44,53 @@ class TextFileLoader:
         self.path = path
         self.encoding = encoding
 
-    def load(self):
+    def _is_directory(self) -> bool:
         if os.path.isdir(self.path):
+            return True
+        if os.path.isfile(self.path) and self.path.endswith(".txt"):
+            return False
+        raise ValueError("Provided path is neither a valid directory nor a .txt file.")
+
+    def load(self):
+        if self._is_directory():
             self.load_directory()
-        elif os.path.isfile(self.path) and self.path.endswith(".txt"):
-            self.load_file()
         else:
-            raise ValueError(
-                "Provided path is neither a valid directory nor a .txt file."
-            )
+            self.load_file()
 
     def load_file(self):
         with open(self.path, "r", encoding=self.encoding) as f:
             self.documents.append(f.read())
 
     def load_directory(self):
-        for root, _, files in os.walk(self.path):
-            for file in files:
-                if file.endswith(".txt"):
-                    with open(
-                        os.path.join(root, file), "r", encoding=self.encoding
-                    ) as f:
-                        self.documents.append(f.read())
+        for path in _iter_files(self.path, ".txt"):
+            with open(path, "r", encoding=self.encoding) as f:
+                self.documents.append(f.read())
 
     def load_documents(self):
         self.load()
         return self.documents
 
+    def iter_documents(self) -> Iterator[str]:
+        """Yields documents one at a time without storing them in `documents`."""
+        # Validate the path now rather than on the generator's first next().
+        return self._iter_documents(self._is_directory())
+
+    def _iter_documents(self, is_directory: bool) -> Iterator[str]:
+        if is_directory:
+            # _iter_files closes each directory handle before yielding, so
+            # nothing stays open while the caller works between documents.
+            for path in _iter_files(self.path, ".txt"):
+                yield _read_file(path, self.encoding)
+        else:
+            yield _read_file(self.path, self.encoding)
+
 
 class CharacterTextSplitter:
     def __init__(
         self,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        separators: Optional[List[str]] = None,
     ):
         assert (
             chunk_size > chunk_overlap
@@ -48,18 +98,52 @@ class CharacterTextSplitter:
 
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        # e.g. ["\n\n", "\n", " "]; tried in order when snapping chunk ends.
+        self.separators = separators or []
+
+    def _find_break(self, text: str, start: int, end: int) -> int:
+        # Only look in the back half so a chunk never shrinks below half size.
+        lower = start + self.chunk_size // 2
+        for separator in self.separators:
+            index = text.rfind(separator, lower, end)
+            if index != -1:
+                return index + len(separator)
+        return end
+
+    def _split_on_separators(self, text: str) -> Iterator[str]:
+        start = 0
+        while start < len(text):
+            end = start + self.chunk_size
+            if end >= len(text):
+                yield text[start:]
+                return
+            end = self._find_break(text, start, end)
+            yield text[start:end]
+            # Advance at least as far as the unsnapped stride would, but never
+            # past `end`, so snapping neither multiplies chunks nor leaves gaps.
+            stride = self.chunk_size - self.chunk_overlap
+            start = min(end, max(end - self.chunk_overlap, start + stride))
 
     def split(self, text: str) -> List[str]:
-        chunks = []
-        for i in range(0, len(text), self.chunk_size - self.chunk_overlap):
-            chunks.append(text[i : i + self.chunk_size])
-        return chunks
+        if self.separators:
+            return list(self._split_on_separators(text))
+        stride = self.chunk_size - self.chunk_overlap
+        return [text[i : i + self.chunk_size] for i in range(0, len(text), stride)]
 
-    def split_texts(self, texts: List[str]) -> List[str]:
-        chunks = []
+    def split_iter(self, text: str) -> Iterator[str]:
+        """Yields the same chunks as `split` one at a time."""
+        if self.separators:
+            return self._split_on_separators(text)
+        stride = self.chunk_size - self.chunk_overlap
+        return (text[i : i + self.chunk_size] for i in range(0, len(text), stride))
+
+    def iter_split_texts(self, texts: Iterable[str]) -> Iterator[str]:
+        """Yields the chunks of each text in turn, without building a list."""
         for text in texts:
-            chunks.extend(self.split(text))
-        return chunks
+            yield from self.split_iter(text)
+
+    def split_texts(self, texts: List[str]) -> List[str]:
+        return [chunk for text in texts for chunk in self.split(text)]
 
 
 if __name__ == "__main__":